@@ -11,8 +11,88 @@
 # -----------------------------------------------------------------------------
 
 import csv
-import statistics
+import os
 import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Buffer size for CSV files (1 MiB), so they are read and written in
+# large blocks while csv.reader streams rows out of the buffer
+CSV_CHUNK_SIZE = 1 << 20
+
+# Highest mark a student can score
+MAX_MARK = 100
+
+# Value of every valid mark string, '0' to '100', so screening and
+# converting a mark is one dict lookup (and never an int() that can raise)
+_MARK_BY_TEXT = {str(mark): mark for mark in range(MAX_MARK + 1)}
+
+# Lower bound of each grade band, and the letter for each band code (0-4)
+GRADE_THRESHOLDS = [60, 70, 80, 90]
+GRADE_LETTERS = "FDCBA"
+
+# Letter grade for every possible byte-sized mark, built once so grading
+# a mark is a table lookup (and bytes.translate() can grade a whole marks
+# array in one call)
+_GRADE_LETTER_BY_MARK = bytes(ord(GRADE_LETTERS[sum(mark >= t for t in GRADE_THRESHOLDS)])
+                              for mark in range(256))
+
+@dataclass
+class Gradebook:
+    """
+    Student names and marks stored as parallel sequences: names[i]
+    scored marks[i]. Marks are 0-100, so they live in an unsigned
+    byte array (one byte per student) rather than as boxed ints, and
+    name_to_idx maps each name to its position so re-entering a
+    student replaces their mark. After a bulk update() it is None
+    until the next add() needs it.
+    """
+    names: list = field(default_factory=list)
+    marks: array = field(default_factory=lambda: array('B'))
+    name_to_idx: dict = field(default_factory=dict)
+
+    def add(self, name, mark):
+        """
+        Adds a student, or updates the mark of an existing student.
+        Raises ValueError if the mark is outside 0-100.
+        """
+        # Check before storing so the byte array is never handed a value
+        # it cannot hold (which would raise OverflowError mid-load)
+        if not 0 <= mark <= MAX_MARK:
+            raise ValueError(f"Mark must be between 0 and {MAX_MARK}, got {mark}")
+        self._put(name, mark)
+
+    def update(self, marks_by_name):
+        """
+        Adds or updates every student in a {name: mark} dict whose marks
+        are already known to be within 0-100.
+        """
+        if self.names:
+            for name, mark in marks_by_name.items():
+                self._put(name, mark)
+            return
+        # Filling an empty gradebook builds both arrays in one go. Indexing
+        # every name would cost more than reading the rows did, and is only
+        # needed if a student is added later, so _put() builds it then
+        self.names = list(marks_by_name)
+        self.marks = array('B', marks_by_name.values())
+        self.name_to_idx = None
+
+    def _put(self, name, mark):
+        """Stores a mark already known to be within 0-100."""
+        if self.name_to_idx is None:
+            self.name_to_idx = {name: idx for idx, name in enumerate(self.names)}
+        idx = self.name_to_idx.get(name)
+        if idx is None:
+            self.name_to_idx[name] = len(self.names)
+            self.names.append(name)
+            self.marks.append(mark)
+        else:
+            self.marks[idx] = mark
+
+    def __len__(self):
+        return len(self.names)
 
 def print_welcome_menu():
     """Prints the main welcome message and user menu."""
@@ -21,19 +101,20 @@ def print_welcome_menu():
     print("="*40)
     print("Please choose an option:")
     print("  1: Manually enter student data")
+    print("  1b: Paste student data (one 'Name,Marks' per line)")
     print("  2: Load data from a CSV file")
     print("  3: Exit program")
-    return input("Enter your choice (1, 2, or 3): ")
+    return input("Enter your choice (1, 1b, 2, or 3): ")
 
 def get_manual_input():
     """
     (Task 2a)
     Prompts the user to manually enter student names and marks.
-    Returns a dictionary of {name: mark}.
+    Returns a Gradebook.
     """
     print("\n--- Manual Data Entry ---")
     print("Enter student name and mark. Press Enter on an empty name to finish.")
-    marks_dict = {}
+    gradebook = Gradebook()
     while True:
         name = input("Enter student name: ").strip()
         if not name:
@@ -41,166 +122,267 @@ def get_manual_input():
         
         try:
             mark = int(input(f"Enter mark for {name}: ").strip())
-            if 0 <= mark <= 100:
-                marks_dict[name] = mark
-            else:
-                print("Invalid mark. Please enter a value between 0 and 100.")
         except ValueError:
             print("Invalid input. Please enter a numerical mark.")
+            continue
+        # Gradebook.add() rejects marks outside 0-100
+        try:
+            gradebook.add(name, mark)
+        except ValueError:
+            print("Invalid mark. Please enter a value between 0 and 100.")
             
-    return marks_dict
+    return gradebook
+
+def _add_rows(rows, gradebook):
+    """
+    Adds parsed 'Name,Marks' rows to gradebook, skipping empty rows.
+    Each mark is screened and converted with a lookup in _MARK_BY_TEXT,
+    so no exception handling runs per row, and the valid rows are
+    stored with a single Gradebook.update().
+    """
+    loaded = {}
+    mark_by_text = _MARK_BY_TEXT.get
+    for row in rows:
+        if not row:  # Skip empty rows
+            continue
+        mark_str = row[1].strip() if len(row) > 1 else ''
+        mark = mark_by_text(mark_str)
+        if mark is None and mark_str[:1] == '0':
+            # Zero-padded marks such as 0099 are valid too
+            mark = mark_by_text(mark_str.lstrip('0') or '0')
+        if mark is None:
+            print(f"Skipping invalid row: {row}")
+        else:
+            # A later row for the same student replaces the earlier mark
+            loaded[row[0].strip()] = mark
+    gradebook.update(loaded)
+
+def _advise_sequential(file):
+    """
+    Tells the OS the file will be read front to back so it can read
+    ahead aggressively. Only some platforms (e.g. Linux) support this;
+    elsewhere it does nothing.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Only a hint; reading works the same without it
+
+def get_pasted_input():
+    """
+    (Task 2a, bulk entry)
+    Reads pasted 'Name,Marks' lines from standard input until a blank
+    line or end of input, without prompting for each student.
+    Returns a Gradebook.
+    """
+    print("\n--- Paste Student Data ---")
+    print("Paste one 'Name,Marks' line per student. Enter a blank line to finish.")
+    lines = []
+    for line in sys.stdin:
+        if not line.strip():
+            break
+        lines.append(line)
+
+    gradebook = Gradebook()
+    try:
+        _add_rows(csv.reader(lines), gradebook)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+    return gradebook
 
 def load_from_csv():
     """
     (Task 2b)
     Prompts the user for a CSV filename and loads the data.
     Assumes CSV format: 'Name,Marks' (with a header row)
-    Returns a dictionary of {name: mark}.
+    Returns a Gradebook.
     """
     print("\n--- Load from CSV File ---")
     filename = input("Enter the CSV filename (e.g., 'grades.csv'): ").strip()
-    marks_dict = {}
+    gradebook = Gradebook()
     try:
-        with open(filename, mode='r', encoding='utf-8') as file:
+        with open(filename, mode='r', encoding='utf-8', buffering=CSV_CHUNK_SIZE) as file:
+            # Give the hint before the first read fills the buffer
+            _advise_sequential(file)
             reader = csv.reader(file)
             header = next(reader)  # Skip the header row
             print(f"Loading data from '{filename}' (Header: {', '.join(header)})")
-            
-            for row in reader:
-                if not row:  # Skip empty rows
-                    continue
-                try:
-                    name = row[0].strip()
-                    mark = int(row[1].strip())
-                    marks_dict[name] = mark
-                except (ValueError, IndexError):
-                    print(f"Skipping invalid row: {row}")
-            
+            _add_rows(reader, gradebook)
+
     except FileNotFoundError:
         print(f"Error: The file '{filename}' was not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
         
-    return marks_dict
+    return gradebook
 
 # --- Task 3: Statistical Analysis Functions ---
 
-def calculate_average(marks_dict):
+def calculate_average(gradebook):
     """Calculates the average (mean) of all marks."""
-    if not marks_dict:
-        return 0
-    scores = marks_dict.values()
-    return sum(scores) / len(scores)
+    return summarize(gradebook)[0]
 
-def calculate_median(marks_dict):
+def calculate_median(gradebook):
     """Calculates the median of all marks."""
-    if not marks_dict:
-        return 0
-    return statistics.median(marks_dict.values())
+    return summarize(gradebook)[1]
 
-def get_max_score(marks_dict):
+def get_max_score(gradebook):
     """Finds the student with the highest score. Returns (name, score)."""
-    if not marks_dict:
-        return ("N/A", 0)
-    # Use max() with a lambda function to find the item with the highest value
-    return max(marks_dict.items(), key=lambda item: item[1])
+    return summarize(gradebook)[2]
 
-def get_min_score(marks_dict):
+def get_min_score(gradebook):
     """Finds the student with the lowest score. Returns (name, score)."""
-    if not marks_dict:
-        return ("N/A", 0)
-    # Use min() with a lambda function to find the item with the lowest value
-    return min(marks_dict.items(), key=lambda item: item[1])
+    return summarize(gradebook)[3]
+
+def _median(counts):
+    """
+    Returns the median of a non-empty Counter of integer marks.
+    Marks only take a handful of distinct values, so the middle is
+    found by walking the sorted counts, instead of sorting every mark.
+    """
+    n = sum(counts.values())
+    # 0-based positions of the middle element(s)
+    lo_pos, hi_pos = (n - 1) // 2, n // 2
+    lo = hi = None
+    seen = 0
+    for mark in sorted(counts):
+        seen += counts[mark]
+        if lo is None and seen > lo_pos:
+            lo = mark
+        if seen > hi_pos:
+            hi = mark
+            break
+    if n % 2 == 1:
+        return lo
+    return (lo + hi) / 2
+
+def summarize(gradebook):
+    """
+    Computes all classroom statistics at once.
+    Returns (average, median, (max_name, max_score), (min_name, min_score)).
+    """
+    if not gradebook:
+        return (0, 0, ("N/A", 0), ("N/A", 0))
+    marks, names = gradebook.marks, gradebook.names
+    # Tally the marks once; every statistic below is then derived from
+    # the (at most 101) distinct marks instead of re-reading every student
+    counts = Counter(marks)
+    avg = sum(mark * count for mark, count in counts.items()) / len(marks)
+    max_score, min_score = max(counts), min(counts)
+    # index() returns the first position, so ties go to the earliest student
+    return (avg, _median(counts),
+            (names[marks.index(max_score)], max_score),
+            (names[marks.index(min_score)], min_score))
 
 # --- Task 4: Grade Assignment and Distribution ---
 
-def assign_grades(marks_dict):
+def assign_grades(gradebook):
     """
     Assigns a letter grade to each student based on their mark.
-    Returns a new dictionary {name: grade}.
+    Returns a list of grades, where grades[i] belongs to gradebook.names[i].
     """
-    grades_dict = {}
-    for name, mark in marks_dict.items():
-        if mark >= 90:
-            grades_dict[name] = "A"
-        elif mark >= 80:
-            grades_dict[name] = "B"
-        elif mark >= 70:
-            grades_dict[name] = "C"
-        elif mark >= 60:
-            grades_dict[name] = "D"
-        else:
-            grades_dict[name] = "F"
-    return grades_dict
+    grades, _ = grade_students(gradebook)
+    return grades
+
+def calculate_grade_distribution(grades):
+    """
+    Counts the total number of students in each grade category.
+    grades is any sequence of letter grades with a count() method,
+    such as the list from assign_grades() or a str of letters.
+    """
+    # Report the distribution from A down to F
+    return {grade: grades.count(grade) for grade in reversed(GRADE_LETTERS)}
 
-def calculate_grade_distribution(grades_dict):
-    """Counts the total number of students in each grade category."""
-    distribution = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
-    for grade in grades_dict.values():
-        if grade in distribution:
-            distribution[grade] += 1
-    return distribution
+def grade_students(gradebook):
+    """
+    Assigns grades and counts the grade distribution for the whole
+    class. One bytes.translate() through _GRADE_LETTER_BY_MARK grades
+    every mark, and calculate_grade_distribution() counts those letters
+    with str.count(), both in C.
+    Returns (grades, distribution), where grades is aligned with
+    gradebook.names.
+    """
+    letters = bytes(gradebook.marks).translate(_GRADE_LETTER_BY_MARK).decode('ascii')
+    return list(letters), calculate_grade_distribution(letters)
 
 # --- Task 5: Pass/Fail Filter ---
 
-def print_pass_fail_summary(marks_dict, pass_threshold=40):
+def print_pass_fail_summary(gradebook, pass_threshold=40):
     """
-    Uses list comprehensions to find and print lists of
-    passing and failing students.
+    Splits students into passing and failing lists in a single
+    pass and prints both lists.
     """
-    # Use dictionary comprehensions to create filtered dicts
-    passed_students = {name: score for name, score in marks_dict.items() if score >= pass_threshold}
-    failed_students = {name: score for name, score in marks_dict.items() if score < pass_threshold}
+    # Only the names are printed, so collect names rather than {name: score}
+    passed_students, failed_students = [], []
+    for name, score in zip(gradebook.names, gradebook.marks):
+        if score >= pass_threshold:
+            passed_students.append(name)
+        else:
+            failed_students.append(name)
 
     print("\n--- Pass/Fail Summary ---")
     print(f"Pass Mark: {pass_threshold}")
     print(f"\nTotal Students Passed: {len(passed_students)}")
     if passed_students:
-        # .keys() returns a view object, list() converts it
-        print(f"  Names: {', '.join(passed_students.keys())}") 
+        print(f"  Names: {', '.join(passed_students)}")
 
     print(f"\nTotal Students Failed: {len(failed_students)}")
     if failed_students:
-        print(f"  Names: {', '.join(failed_students.keys())}")
+        print(f"  Names: {', '.join(failed_students)}")
 
 # --- Task 6: Results Table ---
 
-def print_results_table(marks_dict, grades_dict):
+def sort_by_name(gradebook):
+    """Returns student indexes ordered by name, for consistent reports."""
+    return sorted(range(len(gradebook.names)), key=gradebook.names.__getitem__)
+
+def print_results_table(gradebook, grades, order=None):
     """
     Prints a cleanly formatted table of all students, their marks,
-    and their assigned grades.
+    and their assigned grades. order is the index order from
+    sort_by_name(), which is computed if not given.
     """
-    print("\n" + "="*40)
-    print("         Full Grade Report")
-    print("="*40)
-    # Define column widths
-    print(f"{'Name':<20} {'Marks':<10} {'Grade':<10}")
-    print("-" * 40)
-    
-    # Sort dictionary by name for a consistent report
-    for name in sorted(marks_dict.keys()):
-        marks = marks_dict[name]
-        grade = grades_dict.get(name, 'N/A')
-        print(f"{name:<20} {marks:<10} {grade:<10}")
-    print("-" * 40)
+    if order is None:
+        order = sort_by_name(gradebook)
+    names, marks = gradebook.names, gradebook.marks
+
+    # Build the whole table first and write it with a single call
+    lines = [
+        "\n" + "="*40,
+        "         Full Grade Report",
+        "="*40,
+        # Define column widths
+        f"{'Name':<20} {'Marks':<10} {'Grade':<10}",
+        "-" * 40,
+    ]
+    lines.extend(f"{names[i]:<20} {marks[i]:<10} {grades[i]:<10}" for i in order)
+    lines.append("-" * 40)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # --- Bonus: Save to CSV ---
 
-def save_results_to_csv(marks_dict, grades_dict):
-    """Saves the final report (Name, Marks, Grade) to a new CSV file."""
+def save_results_to_csv(gradebook, grades, order=None):
+    """
+    Saves the final report (Name, Marks, Grade) to a new CSV file,
+    in the index order from sort_by_name().
+    """
     filename = input("\nEnter filename to save results (e.g., 'report.csv'): ").strip()
     if not filename.endswith('.csv'):
         filename += '.csv'
         
     try:
-        with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        with open(filename, mode='w', newline='', encoding='utf-8', buffering=CSV_CHUNK_SIZE) as file:
             writer = csv.writer(file)
             # Write header
             writer.writerow(['Name', 'Marks', 'Grade'])
             
-            # Write data rows
-            for name in sorted(marks_dict.keys()):
-                writer.writerow([name, marks_dict[name], grades_dict[name]])
+            # Write data rows in one writerows() call
+            if order is None:
+                order = sort_by_name(gradebook)
+            names, marks = gradebook.names, gradebook.marks
+            writer.writerows((names[i], marks[i], grades[i]) for i in order)
         
         print(f"Successfully saved report to '{filename}'")
         
@@ -215,62 +397,67 @@ def main():
     """
     (Task 1 & 6)
     Main function to run the gradebook analyzer.
-    Contains the primary application loop.
+    Contains the primary application loop, which also ends cleanly
+    when standard input is exhausted.
     """
-    while True:
-        choice = print_welcome_menu()
+    try:
+        while True:
+            choice = print_welcome_menu()
         
-        marks_data = {}
+            gradebook = Gradebook()
         
-        if choice == '1':
-            marks_data = get_manual_input()
-        elif choice == '2':
-            marks_data = load_from_csv()
-        elif choice == '3':
-            print("Exiting program. Goodbye!")
-            sys.exit()  # Exits the script
-        else:
-            print("Invalid choice. Please select 1, 2, or 3.")
-            continue  # Skips the rest of the loop and restarts
-
-        # --- Run Analysis ---
-        # Only run analysis if data was successfully loaded
-        if marks_data:
-            print(f"\n--- Analysis complete for {len(marks_data)} students ---")
-
-            # Task 3: Statistical Analysis
-            avg = calculate_average(marks_data)
-            median = calculate_median(marks_data)
-            (max_name, max_score) = get_max_score(marks_data)
-            (min_name, min_score) = get_min_score(marks_data)
+            if choice == '1':
+                gradebook = get_manual_input()
+            elif choice == '1b':
+                gradebook = get_pasted_input()
+            elif choice == '2':
+                gradebook = load_from_csv()
+            elif choice == '3':
+                print("Exiting program. Goodbye!")
+                sys.exit()  # Exits the script
+            else:
+                print("Invalid choice. Please select 1, 1b, 2, or 3.")
+                continue  # Skips the rest of the loop and restarts
+
+            # --- Run Analysis ---
+            # Only run analysis if data was successfully loaded
+            if gradebook:
+                print(f"\n--- Analysis complete for {len(gradebook)} students ---")
+
+                # Task 3: Statistical Analysis
+                (avg, median, (max_name, max_score), (min_name, min_score)) = summarize(gradebook)
             
-            print("\n--- Classroom Statistics ---")
-            print(f"  Average Score: {avg:.2f}")
-            print(f"  Median Score:  {median}")
-            print(f"  Highest Score: {max_score} (Student: {max_name})")
-            print(f"  Lowest Score:  {min_score} (Student: {min_name})")
-
-            # Task 4: Grade Assignment
-            grades_data = assign_grades(marks_data)
-            distribution = calculate_grade_distribution(grades_data)
+                print("\n--- Classroom Statistics ---")
+                print(f"  Average Score: {avg:.2f}")
+                print(f"  Median Score:  {median}")
+                print(f"  Highest Score: {max_score} (Student: {max_name})")
+                print(f"  Lowest Score:  {min_score} (Student: {min_name})")
+
+                # Task 4: Grade Assignment
+                grades, distribution = grade_students(gradebook)
             
-            print("\n--- Grade Distribution ---")
-            for grade, count in distribution.items():
-                print(f"  Grade {grade}: {count} student(s)")
+                print("\n--- Grade Distribution ---")
+                for grade, count in distribution.items():
+                    print(f"  Grade {grade}: {count} student(s)")
             
-            # Task 5: Pass/Fail
-            print_pass_fail_summary(marks_data, pass_threshold=40)
+                # Task 5: Pass/Fail
+                print_pass_fail_summary(gradebook, pass_threshold=40)
             
-            # Task 6: Results Table
-            print_results_table(marks_data, grades_data)
+                # Task 6: Results Table (sorted once, shared with the CSV export)
+                order = sort_by_name(gradebook)
+                print_results_table(gradebook, grades, order)
             
-            # Bonus: Save to CSV
-            save_choice = input("\nDo you want to save this report to a CSV file? (y/n): ").strip().lower()
-            if save_choice == 'y':
-                save_results_to_csv(marks_data, grades_data)
+                # Bonus: Save to CSV
+                save_choice = input("\nDo you want to save this report to a CSV file? (y/n): ").strip().lower()
+                if save_choice == 'y':
+                    save_results_to_csv(gradebook, grades, order)
 
-        else:
-            print("No data loaded. Returning to main menu.")
+            else:
+                print("No data loaded. Returning to main menu.")
+
+    except EOFError:
+        # Piped or redirected input ran out before the user chose to exit
+        print("\nEnd of input reached. Exiting program. Goodbye!")
 
 
 # Standard Python entry point